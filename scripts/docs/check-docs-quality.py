@@ -12,101 +12,108 @@ import re
 from pathlib import Path
 from collections import defaultdict
 
-def check_for_duplicates():
-    """Check for duplicate content across documentation files."""
-    docs_dir = Path('docs')
-    issues = []
-    
-    # Key phrases that indicate duplication
-    key_phrases = [
-        'smart retry logic',
-        'circuit breaker protection',
-        'exponential backoff',
-        'production-ready error handling',
-        'health monitoring',
-        'transport configuration'
-    ]
-    
-    phrase_locations = defaultdict(list)
-    
-    for doc_file in docs_dir.rglob('*.md'):
-        if 'archive' in str(doc_file):
-            continue
-            
-        with open(doc_file, 'r') as f:
-            content = f.read().lower()
-            for phrase in key_phrases:
-                if phrase.lower() in content:
-                    phrase_locations[phrase].append(doc_file.relative_to(docs_dir))
-    
-    for phrase, locations in phrase_locations.items():
-        if len(locations) > 1:
-            issues.append(f"Duplicate content '{phrase}' in: {', '.join(str(l) for l in locations)}")
-    
-    return issues
+# Key phrases that indicate duplication
+KEY_PHRASES = [
+    'smart retry logic',
+    'circuit breaker protection',
+    'exponential backoff',
+    'production-ready error handling',
+    'health monitoring',
+    'transport configuration'
+]
+PHRASE_RE = re.compile(
+    b'|'.join(re.escape(p.encode()) for p in KEY_PHRASES), re.IGNORECASE
+)
+
+# Patterns that indicate API documentation, fused so each file is scanned once
+API_PATTERNS = [
+    r'pub struct \w+',
+    r'pub fn \w+',
+    r'pub trait \w+',
+    r'pub enum \w+',
+    r'impl \w+ for \w+',
+    r'fn \w+\([^)]*\) -> \w+'
+]
+API_RE = re.compile('|'.join(f'(?:{p})' for p in API_PATTERNS))
+
+# Relative markdown links without an anchor: [text](./page.md)
+LINK_RE = re.compile(r'\[([^\]]+)\]\((\./[^)#]*\.md)\)')
+
+# Link text that likely refers to a specific section
+TRIGGER_WORDS = ('error', 'retry', 'circuit', 'health', 'transport')
+
+def iter_md(root):
+    """Yield markdown files under root, pruning archived subtrees."""
+    subdirs = []
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if 'archive' in entry.name:
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+            elif entry.name.endswith('.md'):
+                yield entry
+    # Files before subdirectories, in the same order rglob used
+    for subdir in subdirs:
+        yield from iter_md(subdir)
 
-def check_for_api_docs():
+def check_for_duplicates(content, rel_path, phrase_locations):
+    """Record which key phrases appear in a documentation file."""
+    # One case-insensitive pass finds every phrase, no lowered copy
+    found = {m.group(0).lower().decode() for m in PHRASE_RE.finditer(content)}
+    for phrase in KEY_PHRASES:
+        if phrase in found:
+            phrase_locations[phrase].append(rel_path)
+
+def check_for_api_docs(text, rel_path, issues):
     """Check for manually written API documentation that should be auto-generated."""
-    docs_dir = Path('docs')
-    issues = []
-    
-    # Patterns that indicate API documentation
-    api_patterns = [
-        r'pub struct \w+',
-        r'pub fn \w+',
-        r'pub trait \w+',
-        r'pub enum \w+',
-        r'impl \w+ for \w+',
-        r'fn \w+\([^)]*\) -> \w+'
-    ]
-    
-    for doc_file in docs_dir.rglob('*.md'):
-        if 'archive' in str(doc_file) or 'api-reference.md' in str(doc_file):
-            continue
-            
-        with open(doc_file, 'r') as f:
-            content = f.read()
-            for pattern in api_patterns:
-                if re.search(pattern, content):
-                    issues.append(f"Manual API docs found in {doc_file.relative_to(docs_dir)} - should be auto-generated")
-                    break
-    
-    return issues
+    if 'api-reference.md' in rel_path:
+        return
+    if API_RE.search(text):
+        issues.append(f"Manual API docs found in {rel_path} - should be auto-generated")
 
-def check_cross_references():
+def check_cross_references(text, name, issues):
     """Check that cross-references use proper anchors."""
-    docs_dir = Path('docs')
-    issues = []
-    
-    # Find all markdown links
-    link_pattern = r'\[([^\]]+)\]\(([^)]+)\)'
-    
-    for doc_file in docs_dir.rglob('*.md'):
-        if 'archive' in str(doc_file):
-            continue
-            
-        with open(doc_file, 'r') as f:
-            content = f.read()
-            links = re.findall(link_pattern, content)
-            
-            for link_text, link_url in links:
-                # Check for vague references
-                if link_url.startswith('./') and '#' not in link_url and link_url.endswith('.md'):
-                    # Check if this could use a more specific anchor
-                    if any(word in link_text.lower() for word in ['error', 'retry', 'circuit', 'health', 'transport']):
-                        issues.append(f"Missing anchor in {doc_file.name}: [{link_text}]({link_url}) - consider adding #section")
+    # Only vague references (relative .md links without #) match LINK_RE
+    for m in LINK_RE.finditer(text):
+        link_text, link_url = m.groups()
+        # Check if this could use a more specific anchor
+        text_lower = link_text.lower()
+        if any(word in text_lower for word in TRIGGER_WORDS):
+            issues.append(f"Missing anchor in {name}: [{link_text}]({link_url}) - consider adding #section")
+
+def scan_docs(docs_dir='docs'):
+    """Read each documentation file once and run every check over it."""
+    phrase_locations = defaultdict(list)
+    api_docs = []
+    refs = []
+    
+    for entry in iter_md(docs_dir):
+        content = Path(entry.path).read_bytes()
+        text = content.decode('utf-8', errors='replace')
+        rel_path = os.path.relpath(entry.path, docs_dir)
+        
+        check_for_duplicates(content, rel_path, phrase_locations)
+        check_for_api_docs(text, rel_path, api_docs)
+        check_cross_references(text, entry.name, refs)
+    
+    duplicates = [
+        f"Duplicate content '{phrase}' in: {', '.join(locations)}"
+        for phrase, locations in phrase_locations.items()
+        if len(locations) > 1
+    ]
     
-    return issues
+    return duplicates, api_docs, refs
 
 def main():
     print("\nSearch: Documentation Quality Check\n")
     print("=" * 40)
     
     all_issues = []
+    duplicates, api_docs, refs = scan_docs()
     
     # Check for duplicates
     print("\nChecking for duplicate content...")
-    duplicates = check_for_duplicates()
     if duplicates:
         print(f"[!] Found {len(duplicates)} duplication issues:")
         for issue in duplicates:
@@ -117,7 +124,6 @@ def main():
     
     # Check for manual API docs
     print("\nChecking for manual API documentation...")
-    api_docs = check_for_api_docs()
     if api_docs:
         print(f"[!] Found {len(api_docs)} manual API doc issues:")
         for issue in api_docs:
@@ -128,7 +134,6 @@ def main():
     
     # Check cross-references
     print("\nChecking cross-references...")
-    refs = check_cross_references()
     if refs:
         print(f"Warning:  Found {len(refs)} cross-reference improvements:")
         for issue in refs: